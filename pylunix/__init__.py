@@ -1,3 +1,14 @@
 __version__ = "0.1.0"
 
-from .controls import *
\ No newline at end of file
+from . import controls
+from .controls import __all__ as __all__
+
+def __getattr__(name):
+    # Forward to the lazily-populated controls package so `from pylunix
+    # import PushButton` still works without importing every control here.
+    if name in __all__:
+        return getattr(controls, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
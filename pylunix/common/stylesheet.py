@@ -10,6 +10,8 @@ class PyLunixStyleSheet(Enum):
         obj = object.__new__(cls)
         obj._value_ = value
         obj._components_dir = components_dir
+        obj._value_cache = {}
+        obj._value_cache_theme = None
         return obj
     
     BUTTON = "button", "controls"
@@ -27,5 +29,16 @@ class PyLunixStyleSheet(Enum):
             theme_manager.register(widget, components_dir, self.value)
 
     def get_value(self, name:str, components_dir:str=None):
-        components_dir = self._components_dir if components_dir is None else components_dir
-        return theme_manager.get_resolved_value(name, components_dir, self.value)
\ No newline at end of file
+        if components_dir is not None and components_dir != self._components_dir:
+            return theme_manager.get_resolved_value(name, components_dir, self.value)
+
+        if self._value_cache_theme != theme_manager.theme:
+            self._value_cache.clear()
+            self._value_cache_theme = theme_manager.theme
+
+        if name in self._value_cache:
+            return self._value_cache[name]
+
+        value = theme_manager.get_resolved_value(name, self._components_dir, self.value)
+        self._value_cache[name] = value
+        return value
\ No newline at end of file
@@ -28,6 +28,9 @@ class ThemeManager:
 
     def __init__(self):
         self.theme = "Default"
+        # Bumped on every theme switch; lets callers validate cached resolved
+        # values with a single integer compare instead of re-resolving.
+        self.theme_version = 0
 
         self.common_yaml_path = COMMON_THEME_YAML
         self.yaml_processor = YAMLProcessor(str(self.common_yaml_path))
@@ -102,8 +105,9 @@ class ThemeManager:
     
     def set_theme(self, theme: str="Default"):
         if self.theme == theme:
-            return 
+            return
         self.theme = theme
+        self.theme_version += 1
 
         with self._CACHE_LOCK:
             self._RESOLVED_CACHE.clear()
@@ -64,7 +64,8 @@ class WidgetRegistry:
     def _apply_qss_from_path(self, widget, qss_path: Path) -> bool:
         try:
             qss_content = self._qss_manager.apply_to_file(str(qss_path))
-            widget.setStyleSheet(qss_content)
+            if widget.styleSheet() != qss_content:
+                widget.setStyleSheet(qss_content)
             return True
         except Exception:
             logger.exception("Failed to apply QSS from %s", qss_path)
@@ -1,24 +1,36 @@
-from .button.button import BaseButton, PushButton, PrimaryButton, TransparentPushButton
-from .check_box.check_box import CheckBox
-from .hyperlink_button.hyperlink_button import HyperlinkButton
-from .radio_button.radio_button import RadioButton
-from .repeat_button.repeat_button import RepeatButton
-from .toggle_button.toggle_button import ToggleButton, TransparentToggleButton, SegmentedButton
-from .tool_button.tool_button import ToolButton, PrimaryToolButton, TransparentToggleToolButton, TransparentToolButton, ToggleToolButton
+# Controls are imported lazily (PEP 562): each class pulls in PyQt5 modules
+# and stylesheet/YAML machinery, so resolving them on first attribute access
+# keeps `import pylunix` cheap for apps that use only a few controls.
 
-__all__ = ["BaseButton",
-           "CheckBox",
-           "HyperlinkButton",
-           "PrimaryButton",
-           "PrimaryToolButton",
-           "PushButton",
-           "RadioButton",
-           "RepeatButton",
-           "SegmentedButton",
-           "ToggleButton",
-           "ToggleToolButton",
-           "ToolButton",
-           "TransparentToggleButton",
-           "TransparentToggleToolButton",
-           "TransparentToolButton",
-           "TransparentPushButton",]
\ No newline at end of file
+_CONTROL_MODULES = {
+    "BaseButton": ".button.button",
+    "PushButton": ".button.button",
+    "PrimaryButton": ".button.button",
+    "TransparentPushButton": ".button.button",
+    "CheckBox": ".check_box.check_box",
+    "HyperlinkButton": ".hyperlink_button.hyperlink_button",
+    "RadioButton": ".radio_button.radio_button",
+    "RepeatButton": ".repeat_button.repeat_button",
+    "ToggleButton": ".toggle_button.toggle_button",
+    "TransparentToggleButton": ".toggle_button.toggle_button",
+    "SegmentedButton": ".toggle_button.toggle_button",
+    "ToolButton": ".tool_button.tool_button",
+    "PrimaryToolButton": ".tool_button.tool_button",
+    "ToggleToolButton": ".tool_button.tool_button",
+    "TransparentToolButton": ".tool_button.tool_button",
+    "TransparentToggleToolButton": ".tool_button.tool_button",
+}
+
+__all__ = sorted(_CONTROL_MODULES)
+
+def __getattr__(name):
+    module_name = _CONTROL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
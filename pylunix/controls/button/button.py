@@ -1,24 +1,101 @@
+from collections import OrderedDict
 from typing import Union, Callable
 from PyQt5.QtWidgets import QPushButton, QWidget
 from PyQt5.QtGui import QIcon, QPainter
 from PyQt5.QtCore import QSize, QRectF, Qt, QTimer
 
-from ...common.stylesheet import PyLunixStyleSheet
+from ...common.stylesheet import PyLunixStyleSheet, theme_manager
+
+# Composing enum flags allocates a new flag object per |; build once.
+_RENDER_HINTS = QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform
+_TEXT_ALIGN = Qt.AlignLeft | Qt.AlignVCenter
+
+_RESOLVED_KEY_TABLES = {}
+
+def _resolved_colors(sheet: PyLunixStyleSheet, keys: tuple) -> tuple:
+    """Resolve a foreground key tuple in one batch, reused until the theme changes.
+
+    Shared across all instances of a button class: after a theme switch the
+    first caller rebuilds the tuple, every other button pays one dict lookup
+    and an integer compare.
+    """
+    version = theme_manager.theme_version
+    entry = _RESOLVED_KEY_TABLES.get((sheet, keys))
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    colors = tuple(sheet.get_value(name) for name in keys)
+    _RESOLVED_KEY_TABLES[(sheet, keys)] = (version, colors)
+    return colors
+
+# Rendered icons shared across all buttons, keyed by (source, state key)
+# and LRU-bounded so theme/contrast cycling can't grow memory without limit.
+# Keys hold the accessor itself — setIcon accepts arbitrary callables, so a
+# collected accessor must never alias a new one through address reuse; the
+# LRU cap bounds how many accessors the cache keeps alive.
+_ICON_LRU = OrderedDict()
+_ICON_LRU_MAX = 512
+
+def _cached_source_icon(icon_source, cache_key, color: str) -> QIcon:
+    key = (icon_source, cache_key)
+    icon = _ICON_LRU.get(key)
+    if icon is None:
+        icon = icon_source(color)
+        if len(_ICON_LRU) >= _ICON_LRU_MAX:
+            _ICON_LRU.popitem(last=False)
+        _ICON_LRU[key] = icon
+    else:
+        _ICON_LRU.move_to_end(key)
+    return icon
+
+_TEXT_ADVANCE_CACHE = {}
+_TEXT_ADVANCE_CACHE_MAX = 2048
+
+def _state_index(button) -> int:
+    """Pack the interaction state into an index: 0=disabled, 1=pressed, 2=hover, 3=rest."""
+    if not button.isEnabled():
+        return 0
+    if button.isPressed:
+        return 1
+    if button.isHover:
+        return 2
+    return 3
+
+def _text_advance(font_metrics, font_key: str, text: str) -> int:
+    """Cached fontMetrics.horizontalAdvance; text shaping is costly per paint."""
+    key = (font_key, text)
+    width = _TEXT_ADVANCE_CACHE.get(key)
+    if width is None:
+        width = font_metrics.horizontalAdvance(text)
+        if len(_TEXT_ADVANCE_CACHE) >= _TEXT_ADVANCE_CACHE_MAX:
+            _TEXT_ADVANCE_CACHE.clear()
+        _TEXT_ADVANCE_CACHE[key] = width
+    return width
 
 class BaseButton(QPushButton):
+    _FOREGROUND_KEYS = ("ButtonForegroundDisabled", "ButtonForegroundPressed",
+                        "ButtonForegroundPointerOver", "ButtonForeground")
+
     def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
         super().__init__(text=text, parent=parent)
         self.isPressed = False
         self.isHover = False
-        self._icon_cache = {}
+        self._icon = QIcon()
         self._icon_source = None
         self._current_icon_color = None
-
-        self.setProperty("class", "PushButton")
-        self.setMinimumHeight(32)
-        self.setIconSize(QSize(16, 16))
-        self.setText(text if text else "")
-        self.setIcon(icon if icon else QIcon())
+        self._icon_update_pending = False
+        # Subclass constructors park their stylesheet here; it is applied on
+        # first show so buttons that never appear skip QSS parsing/polishing.
+        self._pending_stylesheet = None
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.setProperty("class", "PushButton")
+            self.setMinimumHeight(32)
+            self.setIconSize(QSize(16, 16))
+            self.setText(text if text else "")
+            self.setIcon(icon if icon else QIcon())
+        finally:
+            self.setUpdatesEnabled(True)
 
     def setIcon(self, icon: Union[QIcon, Callable]):
         if callable(icon):
@@ -34,27 +111,23 @@ class BaseButton(QPushButton):
         self.updateIcon()
 
     def _get_icon_color(self) -> str:
-        if not self.isEnabled():
-            name = "ButtonForegroundDisabled"
-        elif self.isPressed:
-            name = "ButtonForegroundPressed"
-        elif self.isHover:
-            name = "ButtonForegroundPointerOver"
-        else:
-            name = "ButtonForeground"
-        return PyLunixStyleSheet.BUTTON.get_value(name)
+        return _resolved_colors(PyLunixStyleSheet.BUTTON, self._FOREGROUND_KEYS)[_state_index(self)]
 
     def updateIcon(self):
-        if not callable(getattr(self, "_icon_source", None)):
+        if not callable(self._icon_source):
+            return
+        if not self.isVisibleTo(self.window()):
+            # Hidden buttons (collapsed menus, background tabs) skip the
+            # render; _current_icon_color is left untouched, so the
+            # updateIcon in showEvent performs the deferred refresh once.
             return
         color = self._get_icon_color()
         if color == self._current_icon_color:
             return
         self._current_icon_color = color
-        if color not in self._icon_cache:
-            self._icon_cache[color] = self._icon_source(color)
-        super().setIcon(self._icon_cache[color])
-        self._icon = self._icon_cache[color]
+        icon = _cached_source_icon(self._icon_source, color, color)
+        super().setIcon(icon)
+        self._icon = icon
 
     def sizeHint(self):
         base = super().sizeHint()
@@ -64,37 +137,41 @@ class BaseButton(QPushButton):
             return QSize(base.width(), icon_h + 10)
         return base
 
-    def enterEvent(self, e): self.isHover = True; self.updateIcon(); super().enterEvent(e)
-    def leaveEvent(self, e): self.isHover = False; self.updateIcon(); super().leaveEvent(e)
-    def mousePressEvent(self, e): self.isPressed = True; self.updateIcon(); super().mousePressEvent(e)
-    def mouseReleaseEvent(self, e): self.isPressed = False; self.updateIcon(); super().mouseReleaseEvent(e)
+    def _request_icon_update(self):
+        """Coalesce bursts of state transitions into one icon refresh per event-loop tick."""
+        if self._icon_update_pending:
+            return
+        self._icon_update_pending = True
+        QTimer.singleShot(0, self._flush_icon_update)
+
+    def _flush_icon_update(self):
+        self._icon_update_pending = False
+        self.updateIcon()
+        self.update()
+
+    def enterEvent(self, e): self.isHover = True; self._request_icon_update(); super().enterEvent(e)
+    def leaveEvent(self, e): self.isHover = False; self._request_icon_update(); super().leaveEvent(e)
+    def mousePressEvent(self, e): self.isPressed = True; self._request_icon_update(); super().mousePressEvent(e)
+    def mouseReleaseEvent(self, e): self.isPressed = False; self._request_icon_update(); super().mouseReleaseEvent(e)
 
     def showEvent(self, e):
+        if self._pending_stylesheet is not None:
+            stylesheet, self._pending_stylesheet = self._pending_stylesheet, None
+            stylesheet.apply(self)
         super().showEvent(e)
         self.updateIcon()
 
     def paintEvent(self, e):
         super().paintEvent(e)
 
-        if callable(getattr(self, "_icon", None)):
-            self.updateIcon()
-        current_icon = getattr(self, "_icon", None)
-        if not hasattr(current_icon, "isNull") or current_icon.isNull():
+        if self._icon.isNull():
             return
 
-        painter = QPainter(self)
-        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
-
-        if not self.isEnabled():
-            painter.setOpacity(0.36)
-        elif self.isPressed:
-            painter.setOpacity(0.78)
-
         icon_width = self.iconSize().width()
         icon_height = self.iconSize().height()
         icon_y = (self.height() - icon_height) / 2
 
-        text_width = self.fontMetrics().horizontalAdvance(self.text()) if self.text() else 0
+        text_width = _text_advance(self.fontMetrics(), self.font().key(), self.text()) if self.text() else 0
         spacing = 6
 
         total_width = icon_width + spacing + text_width if text_width else icon_width
@@ -103,8 +180,20 @@ class BaseButton(QPushButton):
         if self.layoutDirection() == Qt.LayoutDirection.RightToLeft:
             icon_x = self.width() - icon_x - icon_width
 
-        rect = QRectF(icon_x, icon_y, icon_width, icon_height)
-        self._icon.paint(painter, rect.toRect())
+        rect = QRectF(icon_x, icon_y, icon_width, icon_height).toRect()
+        if not e.rect().intersects(rect):
+            # Sub-region repaint that misses the icon: super() already drew it.
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHints(_RENDER_HINTS)
+
+        if not self.isEnabled():
+            painter.setOpacity(0.36)
+        elif self.isPressed:
+            painter.setOpacity(0.78)
+
+        self._icon.paint(painter, rect)
 
         painter.end()
 
@@ -113,29 +202,21 @@ class PushButton(BaseButton):
         super().__init__(text=text, icon=icon, parent=parent)
         self.setProperty("class", "PushButton")
 
-        PyLunixStyleSheet.BUTTON.apply(self)
+        self._pending_stylesheet = PyLunixStyleSheet.BUTTON
 
 class PrimaryButton(BaseButton):
+    _FOREGROUND_KEYS = ("AccentButtonForegroundDisabled", "AccentButtonForegroundPressed",
+                        "AccentButtonForegroundPointerOver", "AccentButtonForeground")
+
     def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
         super().__init__(text=text, icon=icon, parent=parent)
         self.setProperty("class", "PrimaryButton")
 
-        PyLunixStyleSheet.BUTTON.apply(self)
-
-    def _get_icon_color(self) -> str:
-        if not self.isEnabled():
-            name = "AccentButtonForegroundDisabled"
-        elif self.isPressed:
-            name = "AccentButtonForegroundPressed"
-        elif self.isHover:
-            name = "AccentButtonForegroundPointerOver"
-        else:
-            name = "AccentButtonForeground"
-        return PyLunixStyleSheet.BUTTON.get_value(name)
+        self._pending_stylesheet = PyLunixStyleSheet.BUTTON
 
 class TransparentPushButton(BaseButton):
     def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
         super().__init__(text=text, icon=icon, parent=parent)
         self.setProperty("class", "TransparentPushButton")
 
-        PyLunixStyleSheet.BUTTON.apply(self)
\ No newline at end of file
+        self._pending_stylesheet = PyLunixStyleSheet.BUTTON
\ No newline at end of file
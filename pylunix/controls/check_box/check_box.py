@@ -1,17 +1,60 @@
 from typing import Union, Callable
 from PyQt5.QtWidgets import QCheckBox, QWidget, QStyleOptionButton, QStyle
-from PyQt5.QtGui import QIcon, QPainter, QColor, QPen
+from PyQt5.QtGui import QIcon, QPainter, QColor, QPen, QBrush, QPixmap, QPixmapCache
 from PyQt5.QtCore import QSize, Qt, QRect
 
-from ...common.stylesheet import PyLunixStyleSheet
+from ...common.stylesheet import PyLunixStyleSheet, theme_manager
 from ...icon_manager.win_icons.win_icon import WinIcon
+from ...utils.color_utils import qcolor
+from ..button.button import _state_index, _resolved_colors
+
+def _build_color_key_table(family: str):
+    """Precompute stylesheet keys for a color family, indexed by (checked<<2)|state."""
+    keys = [None] * 8
+    for checked in (False, True):
+        base = family + ("Checked" if checked else "Unchecked")
+        for state, suffix in enumerate(("Disabled", "Pressed", "PointerOver", "")):
+            keys[(checked << 2) | state] = base + suffix
+    return tuple(keys)
 
 class CheckBox(QCheckBox):
+    _FOREGROUND_KEYS = _build_color_key_table("CheckBoxForeground")
+    _GLYPH_KEYS = _build_color_key_table("CheckBoxCheckGlyphForeground")
+    _FILL_KEYS = _build_color_key_table("CheckBoxCheckBackgroundFill")
+    _STROKE_KEYS = _build_color_key_table("CheckBoxCheckBackgroundStroke")
+
+    # QPen/QBrush shared across all checkboxes; the theme palette is tiny,
+    # the cap only guards against pathological dynamic color strings.
+    _PEN_CACHE = {}
+    _BRUSH_CACHE = {}
+    _PAINT_CACHE_MAX = 64
+
+    @classmethod
+    def _pen(cls, color: str) -> QPen:
+        pen = cls._PEN_CACHE.get(color)
+        if pen is None:
+            if len(cls._PEN_CACHE) >= cls._PAINT_CACHE_MAX:
+                cls._PEN_CACHE.clear()
+            pen = cls._PEN_CACHE[color] = QPen(qcolor(color), 1)
+        return pen
+
+    @classmethod
+    def _brush(cls, color: str) -> QBrush:
+        brush = cls._BRUSH_CACHE.get(color)
+        if brush is None:
+            if len(cls._BRUSH_CACHE) >= cls._PAINT_CACHE_MAX:
+                cls._BRUSH_CACHE.clear()
+            brush = cls._BRUSH_CACHE[color] = QBrush(qcolor(color))
+        return brush
+
     def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
         super().__init__(text, parent)
         self.isPressed = False
         self.isHover = False
         self._icon_source = None
+        self._icon_cache = {}
+        self._current_icon_color = None
+        self._update_pending = False
 
         self.setProperty("class", "CheckBox")
         self.setIconSize(QSize(16, 16))
@@ -34,107 +77,104 @@ class CheckBox(QCheckBox):
         self._icon_source = icon_accessor
         self.updateIcon()
 
+    def _color_state_index(self) -> int:
+        return (self.isChecked() << 2) | _state_index(self)
+
     def _get_icon_color(self) -> str:
-        if not self.isEnabled():
-            name = "CheckBoxForegroundCheckedDisabled" if self.isChecked() else "CheckBoxForegroundUncheckedDisabled"
-        elif self.isPressed:
-            name = "CheckBoxForegroundCheckedPressed" if self.isChecked() else "CheckBoxForegroundUncheckedPressed"
-        elif self.isHover:
-            name = "CheckBoxForegroundCheckedPointerOver" if self.isChecked() else "CheckBoxForegroundUncheckedPointerOver"
-        else:
-            name = "CheckBoxForegroundChecked" if self.isChecked() else "CheckBoxForegroundUnchecked"
-        return PyLunixStyleSheet.CHECK_BOX.get_value(name)
-    
+        return _resolved_colors(PyLunixStyleSheet.CHECK_BOX, self._FOREGROUND_KEYS)[self._color_state_index()]
+
     def _get_indicator_icon_color(self) -> str:
-        if not self.isEnabled():
-            name = "CheckBoxCheckGlyphForegroundCheckedDisabled" if self.isChecked() else "CheckBoxCheckGlyphForegroundUncheckedDisabled"
-        elif self.isPressed:
-            name = "CheckBoxCheckGlyphForegroundCheckedPressed" if self.isChecked() else "CheckBoxCheckGlyphForegroundUncheckedPressed"
-        elif self.isHover:
-            name = "CheckBoxCheckGlyphForegroundCheckedPointerOver" if self.isChecked() else "CheckBoxCheckGlyphForegroundUncheckedPointerOver"
-        else:
-            name = "CheckBoxCheckGlyphForegroundChecked" if self.isChecked() else "CheckBoxCheckGlyphForegroundUnchecked"
-        return PyLunixStyleSheet.CHECK_BOX.get_value(name)
+        return _resolved_colors(PyLunixStyleSheet.CHECK_BOX, self._GLYPH_KEYS)[self._color_state_index()]
+
+    def _background_color(self) -> str:
+        return _resolved_colors(PyLunixStyleSheet.CHECK_BOX, self._FILL_KEYS)[self._color_state_index()]
+
+    def _border_color(self) -> str:
+        return _resolved_colors(PyLunixStyleSheet.CHECK_BOX, self._STROKE_KEYS)[self._color_state_index()]
 
     def updateIcon(self):
-        if hasattr(self, "_icon_source") and callable(self._icon_source):
+        if callable(self._icon_source):
             try:
                 color = self._get_icon_color()
-                icon = self._icon_source(color)
+                if color == self._current_icon_color:
+                    return
+                icon = self._icon_cache.get(color)
+                if icon is None:
+                    icon = self._icon_source(color)
+                    self._icon_cache[color] = icon
                 if icon:
+                    self._current_icon_color = color
                     super().setIcon(icon)
                     self._icon = icon
                     self.update()
             except Exception as e:
                 print(f"[CheckBox] Failed to update icon: {e}")
 
+    def _request_update(self):
+        """Schedule one repaint per event-loop burst; cleared in paintEvent."""
+        if not self._update_pending:
+            self._update_pending = True
+            self.update()
+
     def enterEvent(self, event):
         self.isHover = True
         super().enterEvent(event)
-        self.update()
+        self._request_update()
 
     def leaveEvent(self, event):
         self.isHover = False
         super().leaveEvent(event)
-        self.update()
+        self._request_update()
 
     def mousePressEvent(self, event):
         self.isPressed = True
         super().mousePressEvent(event)
+        self._request_update()
 
     def mouseReleaseEvent(self, event):
         self.isPressed = False
         super().mouseReleaseEvent(event)
-
-    def paintEvent(self, e):
-        painter = QPainter(self)
+        self._request_update()
+
+    def _indicator_pixmap(self, rect: QRect, background: str, border: str) -> QPixmap:
+        """Rounded background, border and glyph rendered once per (state, size, theme).
+
+        Served from QPixmapCache; hover/press storms across many checkboxes
+        then cost one drawPixmap per paint instead of re-rasterizing the glyph.
+        """
+        dpr = self.devicePixelRatioF()
+        key = "pylunix_cb:{}:{}:{}x{}:{}:{}".format(
+            self._color_state_index(), int(self.checkState()),
+            rect.width(), rect.height(), dpr, theme_manager.theme_version)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+
+        pixmap = QPixmap(int(rect.width() * dpr), int(rect.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
 
-        opt = QStyleOptionButton()
-        self.initStyleOption(opt)
-        rect = self.style().subElementRect(QStyle.SubElement.SE_CheckBoxIndicator, opt, self)
-        
-        def _background_color() -> str:
-            if not self.isEnabled():
-                name = "CheckBoxCheckBackgroundFillCheckedDisabled" if self.isChecked() else "CheckBoxCheckBackgroundFillUncheckedDisabled"
-            elif self.isPressed:
-                name = "CheckBoxCheckBackgroundFillCheckedPressed" if self.isChecked() else "CheckBoxCheckBackgroundFillUncheckedPressed"
-            elif self.isHover:
-                name = "CheckBoxCheckBackgroundFillCheckedPointerOver" if self.isChecked() else "CheckBoxCheckBackgroundFillUncheckedPointerOver"
-            else:
-                name = "CheckBoxCheckBackgroundFillChecked" if self.isChecked() else "CheckBoxCheckBackgroundFillUnchecked"
-            return PyLunixStyleSheet.CHECK_BOX.get_value(name)
-
-        def _border_color() -> str:
-            if not self.isEnabled():
-                name = "CheckBoxCheckBackgroundStrokeCheckedDisabled" if self.isChecked() else "CheckBoxCheckBackgroundStrokeUncheckedDisabled"
-            elif self.isPressed:
-                name = "CheckBoxCheckBackgroundStrokeCheckedPressed" if self.isChecked() else "CheckBoxCheckBackgroundStrokeUncheckedPressed"
-            elif self.isHover:
-                name = "CheckBoxCheckBackgroundStrokeCheckedPointerOver" if self.isChecked() else "CheckBoxCheckBackgroundStrokeUncheckedPointerOver"
-            else:
-                name = "CheckBoxCheckBackgroundStrokeChecked" if self.isChecked() else "CheckBoxCheckBackgroundStrokeUnchecked"
-            return PyLunixStyleSheet.CHECK_BOX.get_value(name)
-
-
-        painter.setBrush(QColor(_background_color()))
-        painter.setPen(QPen(QColor(_border_color()), 1))
-        painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 5, 5)
+        local = QRect(0, 0, rect.width(), rect.height())
+        painter.setBrush(self._brush(background))
+        painter.setPen(self._pen(border))
+        painter.drawRoundedRect(local.adjusted(0, 0, -1, -1), 5, 5)
 
         GLYPH_SIZE = 14
-        
+
         color = self._get_indicator_icon_color()
         indicator_icon = None
 
         target_glyph_accessor = None
-        
+
         if self.checkState() == Qt.CheckState.Checked:
-            target_glyph_accessor = WinIcon.CHECKMARK 
+            target_glyph_accessor = WinIcon.CHECKMARK
         elif self.checkState() == Qt.CheckState.PartiallyChecked:
             if hasattr(WinIcon, 'INDETERMINATE'):
                 target_glyph_accessor = WinIcon.INDETERMINATE
             else:
-                target_glyph_accessor = WinIcon.CHECKMARK 
+                target_glyph_accessor = WinIcon.CHECKMARK
 
         if target_glyph_accessor and callable(target_glyph_accessor):
             try:
@@ -143,16 +183,37 @@ class CheckBox(QCheckBox):
                 print(f"[CheckBox] Failed to get themed indicator icon: {e}")
 
         if isinstance(indicator_icon, QIcon):
-            pixmap = indicator_icon.pixmap(QSize(GLYPH_SIZE, GLYPH_SIZE), QIcon.Mode.Normal if self.isEnabled() else QIcon.Mode.Disabled)
-            icon_rect = QRect(
-                rect.x() + (rect.width() - pixmap.width()) // 2,
-                rect.y() + (rect.height() - pixmap.height()) // 2,
-                pixmap.width(),
-                pixmap.height()
-            )
-            painter.drawPixmap(icon_rect, pixmap)
+            glyph_rect = QRect(0, 0, GLYPH_SIZE, GLYPH_SIZE)
+            glyph_rect.moveCenter(local.center())
+            indicator_icon.paint(painter, glyph_rect, Qt.AlignmentFlag.AlignCenter,
+                                 QIcon.Mode.Normal if self.isEnabled() else QIcon.Mode.Disabled,
+                                 QIcon.State.On if self.isChecked() else QIcon.State.Off)
+
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def paintEvent(self, e):
+        self._update_pending = False
+        painter = QPainter(self)
+        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
+
+        # Honor the dirty region: clip at the raster level and skip the
+        # indicator/label blocks entirely when they aren't invalidated.
+        region = e.region()
+        painter.setClipRegion(region)
+
+        opt = QStyleOptionButton()
+        self.initStyleOption(opt)
+        rect = self.style().subElementRect(QStyle.SubElement.SE_CheckBoxIndicator, opt, self)
+        indicator_dirty = region.intersects(rect)
+
+        if indicator_dirty:
+            painter.drawPixmap(rect.topLeft(),
+                               self._indicator_pixmap(rect, self._background_color(), self._border_color()))
 
         content_rect = self.style().subElementRect(QStyle.SubElement.SE_CheckBoxContents, opt, self)
-        opt.rect = content_rect
-        self.style().drawControl(QStyle.ControlElement.CE_CheckBoxLabel, opt, painter, self)
+        if region.intersects(content_rect):
+            opt.rect = content_rect
+            self.style().drawControl(QStyle.ControlElement.CE_CheckBoxLabel, opt, painter, self)
         painter.end()
\ No newline at end of file
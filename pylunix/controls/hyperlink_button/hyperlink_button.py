@@ -92,7 +92,7 @@ class HyperlinkButton(QPushButton):
             name = "HyperlinkButtonForegroundPointerOver"
         else:
             name = "HyperlinkButtonForeground"
-        return PyLunixStyleSheet.BUTTON.color(name)
+        return PyLunixStyleSheet.HYPERLINK_BUTTON.get_value(name)
 
     def enterEvent(self, e): self.isHover = True; self.updateIcon(); super().enterEvent(e)
     def leaveEvent(self, e): self.isHover = False; self.updateIcon(); super().leaveEvent(e)
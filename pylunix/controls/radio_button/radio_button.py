@@ -5,12 +5,36 @@ from PyQt5.QtCore import QSize, QRectF, Qt
 
 from ...common.stylesheet import PyLunixStyleSheet
 
+def _build_indicator_key_table():
+    """Precompute (checked, enabled, pressed, hover) -> (border, fill, dot) stylesheet keys."""
+    table = {}
+    for checked in (False, True):
+        for enabled in (False, True):
+            for pressed in (False, True):
+                for hover in (False, True):
+                    prefix = "RadioButtonOuterEllipseChecked" if checked else "RadioButtonOuterEllipse"
+                    if not enabled:
+                        border = prefix + "StrokeDisabled"
+                        fill = prefix + "FillDisabled"
+                        dot = "RadioButtonCheckGlyphFillDisabled" if checked else None
+                    else:
+                        suffix = "Pressed" if pressed else "PointerOver" if hover else ""
+                        border = prefix + "Stroke" + suffix
+                        fill = prefix + "Fill" + suffix
+                        dot = "RadioButtonCheckGlyphFill" + suffix if checked else None
+                    table[(checked, enabled, pressed, hover)] = (border, fill, dot)
+    return table
+
 class RadioButton(QRadioButton):
+    _KEY_TABLE = _build_indicator_key_table()
+
     def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
         super().__init__(text=text, parent=parent)
         self.isPressed = False
         self.isHover = False
         self._icon_source = None
+        self._icon_cache = {}
+        self._current_icon_color = None
 
         self.setProperty("class", "RadioButton")
         self.setIconSize(QSize(16, 16))
@@ -19,6 +43,8 @@ class RadioButton(QRadioButton):
         if icon: self.setIcon(icon)
         else: self.setIcon(QIcon())
 
+        self._resolved_colors = {}
+
         PyLunixStyleSheet.RADIO_BUTTON.apply(self)
         self.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)    # macOS
 
@@ -28,7 +54,6 @@ class RadioButton(QRadioButton):
         else:
             super().setIcon(icon)
             self._icon_source = None
-            self._icon = icon
 
     def setIconSource(self, icon_accessor: Callable[[str], QIcon]):
         self._icon_source = icon_accessor
@@ -45,14 +70,24 @@ class RadioButton(QRadioButton):
             name = "RadioButtonForeground"
         return PyLunixStyleSheet.RADIO_BUTTON.get_value(name)
 
+    def refresh_theme(self):
+        """Drop resolved indicator colors so the next paint re-reads the stylesheet."""
+        self._resolved_colors.clear()
+
     def updateIcon(self):
-        if hasattr(self, "_icon_source") and callable(self._icon_source):
+        self.refresh_theme()
+        if callable(self._icon_source):
             try:
                 color = self._get_icon_color()
-                icon = self._icon_source(color)
+                if color == self._current_icon_color:
+                    return
+                icon = self._icon_cache.get(color)
+                if icon is None:
+                    icon = self._icon_source(color)
+                    self._icon_cache[color] = icon
                 if icon:
+                    self._current_icon_color = color
                     super().setIcon(icon)
-                    self._icon = icon
             except Exception as e:
                 print(f"[RadioButton] Failed to update icon: {e}")
 
@@ -71,64 +106,38 @@ class RadioButton(QRadioButton):
         self._drawIndicator(painter)
         painter.end()
 
-    def _drawIndicator(self, painter: QPainter):
-        size = 16
-        cx = 4
-        cy = (self.height() - size) // 2
-        outer_rect = QRectF(cx, cy, size, size)
+    def _resolve_indicator_colors(self, keys):
+        """Resolve (border, fill, dot) QColors for a key triple, caching per state."""
+        colors = self._resolved_colors.get(keys)
+        if colors is None:
+            border_stroke_key, fill_color_key, dot_color_key = keys
+            get_value = PyLunixStyleSheet.RADIO_BUTTON.get_value
 
-        border_stroke_key = "RadioButtonOuterEllipseStroke"
-        fill_color_key = "RadioButtonOuterEllipseFill"
-        dot_color_key = "RadioButtonCheckGlyphFill"
+            border_color = QColor(get_value(border_stroke_key))
 
-        if self.isChecked():
-            if self.isEnabled():
-                border_stroke_key = "RadioButtonOuterEllipseCheckedStroke"
-                fill_color_key = "RadioButtonOuterEllipseCheckedFill"
-                dot_color_key = "RadioButtonCheckGlyphFill"
-                
-                if self.isPressed:
-                    border_stroke_key += "Pressed"
-                    fill_color_key += "Pressed"
-                    dot_color_key += "Pressed"
-                elif self.isHover:
-                    border_stroke_key += "PointerOver"
-                    fill_color_key += "PointerOver"
-                    dot_color_key += "PointerOver"
+            fill_color_value = get_value(fill_color_key)
+            if isinstance(fill_color_value, str) and not fill_color_value.startswith("#"):
+                fill_color = Qt.GlobalColor.transparent
             else:
-                border_stroke_key = "RadioButtonOuterEllipseCheckedStrokeDisabled"
-                fill_color_key = "RadioButtonOuterEllipseCheckedFillDisabled"
-                dot_color_key = "RadioButtonCheckGlyphFillDisabled"
-        
-            border_color = QColor(PyLunixStyleSheet.RADIO_BUTTON.get_value(border_stroke_key))
-            fill_color = QColor(PyLunixStyleSheet.RADIO_BUTTON.get_value(fill_color_key))
-            dot_color = QColor(PyLunixStyleSheet.RADIO_BUTTON.get_value(dot_color_key))
+                fill_color = QColor(fill_color_value)
 
-        else:
-            dot_color = Qt.GlobalColor.transparent
-
-            if self.isEnabled():
-                border_stroke_key = "RadioButtonOuterEllipseStroke"
-                fill_color_key = "RadioButtonOuterEllipseFill"
-                
-                if self.isPressed:
-                    border_stroke_key += "Pressed"
-                    fill_color_key += "Pressed"
-                elif self.isHover:
-                    border_stroke_key += "PointerOver"
-                    fill_color_key += "PointerOver"
+            if dot_color_key is None:
+                dot_color = Qt.GlobalColor.transparent
             else:
-                border_stroke_key = "RadioButtonOuterEllipseStrokeDisabled"
-                fill_color_key = "RadioButtonOuterEllipseFillDisabled"
-            
+                dot_color = QColor(get_value(dot_color_key))
 
-            border_color = QColor(PyLunixStyleSheet.RADIO_BUTTON.get_value(border_stroke_key))
+            colors = (border_color, fill_color, dot_color)
+            self._resolved_colors[keys] = colors
+        return colors
 
-            fill_color_value = PyLunixStyleSheet.RADIO_BUTTON.get_value(fill_color_key)
-            fill_color = QColor(fill_color_value) if fill_color_value.startswith("#") else Qt.GlobalColor.transparent
-            
-            if fill_color_value.lower().endswith("transparentbrush"):
-                fill_color = Qt.GlobalColor.transparent
+    def _drawIndicator(self, painter: QPainter):
+        size = 16
+        cx = 4
+        cy = (self.height() - size) // 2
+        outer_rect = QRectF(cx, cy, size, size)
+
+        keys = self._KEY_TABLE[(self.isChecked(), self.isEnabled(), self.isPressed, self.isHover)]
+        border_color, fill_color, dot_color = self._resolve_indicator_colors(keys)
 
         painter.setRenderHints(QPainter.RenderHint.Antialiasing)
         
@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QTimer, Qt
 
 from ..button.button import BaseButton
 from ...common.stylesheet import PyLunixStyleSheet
@@ -13,20 +13,46 @@ class RepeatButton(BaseButton):
         self._repeat_delay = kwargs.pop("repeat_delay", 400)
         self._repeat_interval = kwargs.pop("repeat_interval", 100)
 
-        self._repeat_timer = QTimer(self)
-        self._repeat_timer.timeout.connect(self._on_repeat_timeout)
+        self._repeat_timer = None
 
-        self.pressed.connect(self._start_repeat)
-        self.released.connect(self._stop_repeat)
         self.setProperty("class", "RepeatButton")
 
-        PyLunixStyleSheet.REPEAT_BUTTON.apply(self)
+        self._pending_stylesheet = PyLunixStyleSheet.REPEAT_BUTTON
+
+    def mousePressEvent(self, event):
+        super().mousePressEvent(event)
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._start_repeat()
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._stop_repeat()
+
+    def keyPressEvent(self, event):
+        # Space (or any key Qt treats as a press key) must drive the repeat
+        # timer just like a mouse press; OS key auto-repeat is ignored so it
+        # doesn't restart the delay phase while held.
+        was_down = self.isDown()
+        super().keyPressEvent(event)
+        if not event.isAutoRepeat() and not was_down and self.isDown():
+            self._start_repeat()
+
+    def keyReleaseEvent(self, event):
+        was_down = self.isDown()
+        super().keyReleaseEvent(event)
+        if not event.isAutoRepeat() and was_down and not self.isDown():
+            self._stop_repeat()
 
     def _start_repeat(self):
+        if self._repeat_timer is None:
+            self._repeat_timer = QTimer(self)
+            self._repeat_timer.timeout.connect(self._on_repeat_timeout)
         self._repeat_timer.start(self._repeat_delay)
 
     def _stop_repeat(self):
-        self._repeat_timer.stop()
+        if self._repeat_timer is not None:
+            self._repeat_timer.stop()
 
     def _on_repeat_timeout(self):
         self.click()
@@ -5,17 +5,41 @@ from PyQt5.QtGui import QIcon
 from ..button.button import BaseButton
 from ...common.stylesheet import PyLunixStyleSheet
 
+def _build_foreground_key_table():
+    """Precompute foreground stylesheet keys indexed by (checked<<3)|(enabled<<2)|(pressed<<1)|hover."""
+    names = [None] * 16
+    for checked in (False, True):
+        for enabled in (False, True):
+            for pressed in (False, True):
+                for hover in (False, True):
+                    name = "ToggleButtonForeground"
+                    if checked:
+                        name += "Checked"
+                    if not enabled:
+                        name += "Disabled"
+                    elif pressed:
+                        name += "Pressed"
+                    elif hover:
+                        name += "PointerOver"
+                    names[(checked << 3) | (enabled << 2) | (pressed << 1) | hover] = name
+    return tuple(names)
+
 class ToggleButton(BaseButton):
+    _CLASS_NAME = "ToggleButton"
+    _FOREGROUND_KEYS = _build_foreground_key_table()
+
     def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
         super().__init__(text=text, icon=icon, parent=parent)
         self._text_on = None
         self._text_off = None
         self._icon_on = None
         self._icon_off = None
-        
+        self._icon_on_is_source = False
+        self._icon_off_is_source = False
+
         self._postInit()
-        self.setProperty("class", "ToggleButton")
-        PyLunixStyleSheet.TOGGLE_BUTTON.apply(self)
+        self.setProperty("class", self._CLASS_NAME)
+        self._pending_stylesheet = PyLunixStyleSheet.TOGGLE_BUTTON
         
     def _postInit(self):
         self.setCheckable(True)
@@ -25,6 +49,8 @@ class ToggleButton(BaseButton):
     def setToggleIcons(self, icon_on: Union[QIcon, Callable], icon_off: Union[QIcon, Callable]):
         self._icon_on = icon_on
         self._icon_off = icon_off
+        self._icon_on_is_source = callable(icon_on)
+        self._icon_off_is_source = callable(icon_off)
         self._applyToggle()
 
     def setToggleText(self, text_on: str, text_off: str):
@@ -35,27 +61,11 @@ class ToggleButton(BaseButton):
     def setChecked(self, checked: bool):
         super().setChecked(checked)
         self._applyToggle()
-        self.updateIcon()
+        self._request_icon_update()
 
     def _get_icon_color(self) -> str:
-        if self.isChecked():
-            if not self.isEnabled():
-                name = "ToggleButtonForegroundCheckedDisabled"
-            elif self.isPressed:
-                name = "ToggleButtonForegroundCheckedPressed"
-            elif self.isHover:
-                name = "ToggleButtonForegroundCheckedPointerOver"
-            else:
-                name = "ToggleButtonForegroundChecked"
-        elif not self.isEnabled():
-            name = "ToggleButtonForegroundDisabled"
-        elif self.isPressed:
-            name = "ToggleButtonForegroundPressed"
-        elif self.isHover:
-            name = "ToggleButtonForegroundPointerOver"
-        else:
-            name = "ToggleButtonForeground"
-        return PyLunixStyleSheet.TOGGLE_BUTTON.get_value(name)
+        idx = (self.isChecked() << 3) | (self.isEnabled() << 2) | (self.isPressed << 1) | self.isHover
+        return PyLunixStyleSheet.TOGGLE_BUTTON.get_value(self._FOREGROUND_KEYS[idx])
         
     def _applyToggle(self):
         if self._text_on and self._text_off:
@@ -63,24 +73,21 @@ class ToggleButton(BaseButton):
             self.setText(text)
 
         if self._icon_on and self._icon_off:
-            icon = self._icon_on if self.isChecked() else self._icon_off
-            if callable(icon):
+            if self.isChecked():
+                icon, is_source = self._icon_on, self._icon_on_is_source
+            else:
+                icon, is_source = self._icon_off, self._icon_off_is_source
+            if is_source:
                 self.setIconSource(icon)
             else:
                 self.setIcon(icon)
 
     def _on_toggle_state_changed(self, checked: bool):
         self._applyToggle()
-        self.updateIcon()
+        self._request_icon_update()
 
 class TransparentToggleButton(ToggleButton):
-    def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
-        super().__init__(text=text, icon=icon, parent=parent)
-        self.setProperty("class", "TransparentToggleButton")
-        PyLunixStyleSheet.TOGGLE_BUTTON.apply(self)
+    _CLASS_NAME = "TransparentToggleButton"
 
 class SegmentedButton(ToggleButton):
-    def __init__(self, text: str = "", icon: QIcon = None, parent: QWidget = None):
-        super().__init__(text=text, icon=icon, parent=parent)
-        self.setProperty("class", "SegmentedButton")
-        PyLunixStyleSheet.TOGGLE_BUTTON.apply(self)
\ No newline at end of file
+    _CLASS_NAME = "SegmentedButton"
\ No newline at end of file
@@ -1,16 +1,38 @@
 from typing import Union, Callable
-from PyQt5.QtWidgets import QWidget, QToolButton
-from PyQt5.QtGui import QIcon, QPainter, QColor
-from PyQt5.QtCore import QSize, QRectF, Qt
+from PyQt5.QtWidgets import QWidget, QToolButton, QStyleOptionToolButton, QStyle
+from PyQt5.QtGui import QIcon, QPainter, QPixmap, QPixmapCache
+from PyQt5.QtCore import QSize, QRectF, Qt, QTimer
 
-from ...common.stylesheet import PyLunixStyleSheet
+from ..button.button import (_text_advance, _state_index, _resolved_colors,
+                             _cached_source_icon, _RENDER_HINTS, _TEXT_ALIGN)
+from ...common.stylesheet import PyLunixStyleSheet, theme_manager
+from ...utils.color_utils import qcolor
+
+# Enough headroom for themed toolbars across states and DPRs; applied only
+# from prewarm so importing the library never clobbers a host-configured
+# QPixmapCache limit.
+_PIXMAP_CACHE_LIMIT_KB = 20480
+
+def _pixmap_cache_key(icon: QIcon, size: QSize, dpr: float) -> str:
+    return "pylunix_tb:{}:{}x{}:{}".format(icon.cacheKey(), size.width(), size.height(), dpr)
 
 class ToolButton(QToolButton):
+    _FOREGROUND_KEYS = ("ToolButtonForegroundDisabled", "ToolButtonForegroundPressed",
+                        "ToolButtonForegroundPointerOver", "ToolButtonForeground")
+
+
     def __init__(self, icon: QIcon, parent: QWidget = None):
         super().__init__(parent=parent)
         self.isPressed = False
         self.isHover = False
+        self._icon = QIcon()
         self._icon_source = None
+        self._icon_update_pending = False
+        self._current_icon_key = None
+        self._last_paint_state = None
+        self._content_pixmap = None
+        self._cached_icon_rect = None
+        self._cached_text_rect = None
 
         self.setProperty("class", "ToolButton")
         self.setIconSize(QSize(16, 16))
@@ -18,7 +40,8 @@ class ToolButton(QToolButton):
         self.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
         # self.adjustToSquare()
 
-        PyLunixStyleSheet.TOOL_BUTTON.apply(self)
+        # Applied on first show; buttons that never appear skip QSS polishing.
+        self._pending_stylesheet = PyLunixStyleSheet.TOOL_BUTTON
 
     def setIcon(self, icon: Union[QIcon, Callable]):
         if callable(icon):
@@ -29,127 +52,222 @@ class ToolButton(QToolButton):
             self._icon = icon
 
     def setIconSource(self, icon_accessor: Callable[[str], QIcon]):
+        if self._icon_source is not None and icon_accessor is not self._icon_source:
+            # Shared LRU entries are keyed by accessor identity; only the
+            # applied-key marker needs resetting.
+            self._current_icon_key = None
         self._icon_source = icon_accessor
         self.updateIcon()
 
+    def _icon_cache_key(self, color: str):
+        return color
+
     def adjustToSquare(self, padding: int = 8):
         size = self.iconSize()
         side = max(size.width(), size.height()) + padding
         self.setFixedSize(side, side)
+        # Fixed-size content never needs repainting on resize; lets Qt keep
+        # the backing store across geometry-only parent relayouts.
+        self.setAttribute(Qt.WA_StaticContents)
 
     def _get_icon_color(self) -> str:
-        if not self.isEnabled():
-            name = "ToolButtonForegroundDisabled"
-        elif self.isPressed:
-            name = "ToolButtonForegroundPressed"
-        elif self.isHover:
-            name = "ToolButtonForegroundPointerOver"
-        else:
-            name = "ToolButtonForeground"
-        return PyLunixStyleSheet.TOOL_BUTTON.get_value(name)
+        return _resolved_colors(PyLunixStyleSheet.TOOL_BUTTON, self._FOREGROUND_KEYS)[_state_index(self)]
 
     def updateIcon(self):
-        if hasattr(self, "_icon_source") and callable(self._icon_source):
+        if callable(self._icon_source):
+            if not self.isVisibleTo(self.window()):
+                # Hidden buttons skip the render; _current_icon_key is left
+                # untouched, so showEvent's updateIcon refreshes once.
+                return
             try:
                 color = self._get_icon_color()
-                icon = self._icon_source(color)
+                key = self._icon_cache_key(color)
+                if key == self._current_icon_key:
+                    return
+                icon = _cached_source_icon(self._icon_source, key, color)
                 if icon:
+                    self._current_icon_key = key
                     super().setIcon(icon)
                     self._icon = icon
             except Exception as e:
                 print(f"[ToolButton] Failed to update icon: {e}")
 
-    def mousePressEvent(self, event): self.isPressed = True; super().mousePressEvent(event)
-    def mouseReleaseEvent(self, event): self.isPressed = False; super().mouseReleaseEvent(event)
-    def enterEvent(self, event): self.isHover = True; self.update(); super().enterEvent(event)
-    def leaveEvent(self, event): self.isHover = False; self.update(); super().leaveEvent(event)
+    def _request_icon_update(self):
+        """Coalesce bursts of state transitions into one icon refresh per event-loop tick."""
+        if self._icon_update_pending:
+            return
+        self._icon_update_pending = True
+        QTimer.singleShot(0, self._flush_icon_update)
+
+    def _flush_icon_update(self):
+        self._icon_update_pending = False
+        self.updateIcon()
+        self.update()
+
+    def mousePressEvent(self, event): self.isPressed = True; self._request_icon_update(); super().mousePressEvent(event)
+    def mouseReleaseEvent(self, event): self.isPressed = False; self._request_icon_update(); super().mouseReleaseEvent(event)
+    def enterEvent(self, event): self.isHover = True; self._request_icon_update(); super().enterEvent(event)
+    def leaveEvent(self, event): self.isHover = False; self._request_icon_update(); super().leaveEvent(event)
 
     def showEvent(self, event):
+        if self._pending_stylesheet is not None:
+            stylesheet, self._pending_stylesheet = self._pending_stylesheet, None
+            stylesheet.apply(self)
         super().showEvent(event)
         self.updateIcon()
 
     def paintEvent(self, event):
-        original_text = self.text()
-        super().setText("")
-        original_icon = self.icon()
-        super().setIcon(QIcon())
-        super().paintEvent(event)
-        super().setText(original_text)
-        super().setIcon(original_icon)
-
-        if not hasattr(self, "_icon") or self._icon.isNull():
-            if not self.text():
-                 return
-
         painter = QPainter(self)
-        painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
 
-        color_name = self._get_icon_color() 
-        current_color = QColor(color_name)
-        painter.setPen(current_color)
+        # Draw only the frame/background; text and icon are rendered by the
+        # cached overlay below. This avoids mutating text/icon and running
+        # the full QToolButton paint pipeline a second time.
+        opt = QStyleOptionToolButton()
+        self.initStyleOption(opt)
+        opt.text = ""
+        opt.icon = QIcon()
+        opt.toolButtonStyle = Qt.ToolButtonIconOnly
+        self.style().drawComplexControl(QStyle.CC_ToolButton, opt, painter, self)
 
-        if not self.isEnabled():
-            painter.setOpacity(0.36)
-        elif self.isPressed:
-            painter.setOpacity(0.78)
+        if self._icon.isNull() and not self.text():
+            painter.end()
+            return
 
+        color_name = self._get_icon_color()
+        # _icon.cacheKey() catches static setIcon swaps that never go through
+        # updateIcon (and hence never touch _current_icon_key).
+        state = (self.isEnabled(), self.isPressed, self.isHover, self.text(), color_name,
+                 self._current_icon_key, self._icon.cacheKey(),
+                 self.iconSize().width(), self.iconSize().height(),
+                 self.width(), self.height(), self.devicePixelRatioF(),
+                 int(self.layoutDirection()), self.font().key())
+        if state != self._last_paint_state or self._content_pixmap is None:
+            self._content_pixmap = self._render_content(color_name)
+            self._last_paint_state = state
+        elif (not event.rect().intersects(self._cached_icon_rect)
+              and not event.rect().intersects(self._cached_text_rect)):
+            # Sub-region repaint that misses the icon and text (focus rects,
+            # partially exposed toolbars): the frame above is enough.
+            painter.end()
+            return
+
+        painter.setRenderHints(_RENDER_HINTS)
+        painter.drawPixmap(0, 0, self._content_pixmap)
+        painter.end()
+
+    def _update_content_geometry(self):
+        """Recompute the icon/text rects; runs only when the overlay is re-rendered."""
         icon_width = self.iconSize().width()
         icon_height = self.iconSize().height()
         icon_y = (self.height() - icon_height) / 2
 
         current_text = self.text()
-        text_width = self.fontMetrics().width(current_text) if current_text else 0
+        text_width = _text_advance(self.fontMetrics(), self.font().key(), current_text) if current_text else 0
         spacing = 6
 
-        has_text = bool(current_text)
         total_width = icon_width
-        if has_text:
+        if current_text:
              total_width += spacing + text_width
 
         start_x = (self.width() - total_width) / 2
         icon_x = start_x
-        
+
         if self.layoutDirection() == Qt.RightToLeft:
-            text_x = start_x
-            icon_x = text_x + text_width + spacing
-        
-        if hasattr(self, "_icon") and not self._icon.isNull():
-            icon_rect = QRectF(icon_x, icon_y, icon_width, icon_height)
-            self._icon.paint(painter, icon_rect.toRect())
-        else:
-            if has_text:
-                text_x = start_x
+            icon_x = start_x + text_width + spacing
+
+        text_x = icon_x + icon_width + spacing
+
+        self._cached_icon_rect = QRectF(icon_x, icon_y, icon_width, icon_height).toRect()
+        self._cached_text_rect = QRectF(text_x, 0, text_width, self.height()).toRect()
+
+    @classmethod
+    def prewarm(cls, icon_source: Callable[[str], QIcon], sizes=(QSize(16, 16),),
+                colors=None, dpr: float = 1.0):
+        """Rasterize an icon source into QPixmapCache ahead of time.
+
+        Call at application bootstrap for toolbar icon sources so first
+        hover/press paints hit the pixmap cache instead of the SVG pipeline.
+        Colors default to the full foreground palette, including the accent
+        variant used by PrimaryToolButton and checked ToggleToolButton.
+        """
+        if QPixmapCache.cacheLimit() < _PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(_PIXMAP_CACHE_LIMIT_KB)
+        if colors is None:
+            colors = set(_resolved_colors(PyLunixStyleSheet.TOOL_BUTTON, cls._FOREGROUND_KEYS))
+            colors.update(_resolved_colors(PyLunixStyleSheet.TOOL_BUTTON,
+                                           PrimaryToolButton._FOREGROUND_KEYS))
+        for color in colors:
+            icon = icon_source(color)
+            for size in sizes:
+                key = _pixmap_cache_key(icon, size, dpr)
+                if QPixmapCache.find(key) is None:
+                    pixmap = icon.pixmap(QSize(int(size.width() * dpr), int(size.height() * dpr)))
+                    pixmap.setDevicePixelRatio(dpr)
+                    QPixmapCache.insert(key, pixmap)
+
+    def _icon_pixmap(self, dpr: float) -> QPixmap:
+        """Fetch the icon pixmap from QPixmapCache instead of re-asking the icon engine."""
+        size = self.iconSize()
+        key = _pixmap_cache_key(self._icon, size, dpr)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._icon.pixmap(QSize(int(size.width() * dpr), int(size.height() * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _render_content(self, color_name: str) -> QPixmap:
+        """Render the icon + text overlay into a transparent pixmap, cached per visual state."""
+        self._update_content_geometry()
+
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
 
-        if has_text:
-            text_x = icon_x + icon_width + spacing
-            text_y = (self.height() + self.fontMetrics().ascent() - self.fontMetrics().descent()) / 2
-            text_rect = QRectF(text_x, 0, text_width, self.height())
-            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, current_text)
+        painter = QPainter(pixmap)
+        painter.setRenderHints(_RENDER_HINTS)
+        painter.setFont(self.font())
+        painter.setPen(qcolor(color_name))
+
+        # Baked into the cached overlay; the state tuple covers enabled and
+        # pressed, so the blit in paintEvent stays a plain opaque copy.
+        if not self.isEnabled():
+            painter.setOpacity(0.36)
+        elif self.isPressed:
+            painter.setOpacity(0.78)
+
+        if not self._icon.isNull():
+            painter.drawPixmap(self._cached_icon_rect, self._icon_pixmap(dpr))
+
+        if self.text():
+            painter.drawText(self._cached_text_rect, _TEXT_ALIGN, self.text())
 
         painter.end()
+        return pixmap
 
 class PrimaryToolButton(ToolButton):
+    _FOREGROUND_KEYS = ("AccentToolButtonForegroundDisabled", "AccentToolButtonForegroundPressed",
+                        "AccentToolButtonForegroundPointerOver", "AccentToolButtonForeground")
+
     def __init__(self, icon: QIcon = None, parent: QWidget = None):
         super().__init__(icon=icon, parent=parent)
         self.setProperty("class", "PrimaryToolButton")
 
-    def _get_icon_color(self) -> str:
-        if not self.isEnabled():
-            name = "AccentToolButtonForegroundDisabled"
-        elif self.isPressed:
-            name = "AccentToolButtonForegroundPressed"
-        elif self.isHover:
-            name = "AccentToolButtonForegroundPointerOver"
-        else:
-            name = "AccentToolButtonForeground"
-        return PyLunixStyleSheet.TOOL_BUTTON.get_value(name)
-    
+
 class ToggleToolButton(ToolButton):
+    # Falsy sentinels so updateIcon calls issued during base construction
+    # (before __init__ assigns the instance dict) take the uncached path.
+    _toggle_cache = ()
+    _toggle_cache_version = None
+
     def __init__(self, icon: QIcon = None, parent: QWidget = None):
         super().__init__(icon=icon, parent=parent)
         self._icon_on = None
         self._icon_off = None
-        
+        self._toggle_cache = {}
+        self._toggle_cache_version = None
+
         self._postInit()
         self.setProperty("class", "ToggleToolButton")
         
@@ -161,27 +279,57 @@ class ToggleToolButton(ToolButton):
     def setToggleIcons(self, icon_on: Union[QIcon, Callable], icon_off: Union[QIcon, Callable]):
         self._icon_on = icon_on
         self._icon_off = icon_off
+        if callable(icon_on) and callable(icon_off):
+            self._prewarm_toggle_cache()
+        else:
+            self._toggle_cache.clear()
         self._applyToggle()
 
+    def _prewarm_toggle_cache(self):
+        """Rasterize both toggle icons for every interaction color up front.
+
+        There are only two toggle states and four colors each, so toggling
+        afterwards is a dict lookup with no SVG pipeline activity.
+        """
+        self._toggle_cache.clear()
+        for checked, accessor in ((True, self._icon_on), (False, self._icon_off)):
+            keys = PrimaryToolButton._FOREGROUND_KEYS if checked else ToolButton._FOREGROUND_KEYS
+            for color in _resolved_colors(PyLunixStyleSheet.TOOL_BUTTON, keys):
+                self._toggle_cache[(checked, color)] = accessor(color)
+        self._toggle_cache_version = theme_manager.theme_version
+
+    def updateIcon(self):
+        if not self._toggle_cache:
+            super().updateIcon()
+            return
+        if not self.isVisibleTo(self.window()):
+            return
+        if self._toggle_cache_version != theme_manager.theme_version:
+            self._prewarm_toggle_cache()
+        color = self._get_icon_color()
+        key = self._icon_cache_key(color)
+        if key == self._current_icon_key:
+            return
+        icon = self._toggle_cache.get((self.isChecked(), color))
+        if icon is None:
+            super().updateIcon()
+            return
+        self._current_icon_key = key
+        QToolButton.setIcon(self, icon)
+        self._icon = icon
+
     def _get_icon_color(self) -> str:
-        if self.isChecked():
-            if not self.isEnabled():
-                name = "AccentToolButtonForegroundDisabled"
-            elif self.isPressed:
-                name = "AccentToolButtonForegroundPressed"
-            elif self.isHover:
-                name = "AccentToolButtonForegroundPointerOver"
-            else:
-                name = "AccentToolButtonForeground"
-        elif not self.isEnabled():
-            name = "ToolButtonForegroundDisabled"
-        elif self.isPressed:
-            name = "ToolButtonForegroundPressed"
-        elif self.isHover:
-            name = "ToolButtonForegroundPointerOver"
-        else:
-            name = "ToolButtonForeground"
-        return PyLunixStyleSheet.TOOL_BUTTON.get_value(name)
+        keys = PrimaryToolButton._FOREGROUND_KEYS if self.isChecked() else ToolButton._FOREGROUND_KEYS
+        return _resolved_colors(PyLunixStyleSheet.TOOL_BUTTON, keys)[_state_index(self)]
+
+    def setIconSource(self, icon_accessor: Callable[[str], QIcon]):
+        # Toggle icons swap accessors on every state change; the cache key
+        # includes the checked state, so keep the cache across swaps.
+        self._icon_source = icon_accessor
+        self.updateIcon()
+
+    def _icon_cache_key(self, color: str):
+        return (color, self.isChecked())
 
     def _applyToggle(self):
         if self._icon_on and self._icon_off:
@@ -193,12 +341,12 @@ class ToggleToolButton(ToolButton):
 
     def _on_toggle_state_changed(self, checked: bool):
         self._applyToggle()
-        self.updateIcon()
+        self._request_icon_update()
 
     def setChecked(self, checked: bool):
         super().setChecked(checked)
         self._applyToggle()
-        self.updateIcon()
+        self._request_icon_update()
 
 class TransparentToolButton(ToolButton):
     def __init__(self, icon: QIcon = None, parent: QWidget = None):
@@ -6,19 +6,28 @@ from PyQt5.QtCore import QSize, Qt
 
 from . import resources_win_rc
 
+_ICON_CACHE = {}
+
 class IconAccessor(str):
     def __call__(self, color: str = None, size: QSize = QSize(16,16)) -> QIcon:
+        key = (str(self), color, size.width(), size.height())
+        icon = _ICON_CACHE.get(key)
+        if icon is not None:
+            return icon
         if color is None or not self.lower().endswith('.svg'):
-            return QIcon(self)
-        renderer = QSvgRenderer(self)
-        pixmap = QPixmap(size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        painter.fillRect(pixmap.rect(), QColor(color))
-        painter.end()
-        return QIcon(pixmap)
+            icon = QIcon(self)
+        else:
+            renderer = QSvgRenderer(self)
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+            painter.fillRect(pixmap.rect(), QColor(color))
+            painter.end()
+            icon = QIcon(pixmap)
+        _ICON_CACHE[key] = icon
+        return icon
 
 class ThemeIconMeta(type):
     def __new__(mcs, name, bases, attrs):
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from PyQt5.QtGui import QColor
+
+@lru_cache(maxsize=256)
+def qcolor(name: str) -> QColor:
+    """Return a shared QColor parsed from a color string.
+
+    Parsing "#AARRGGBB"-style strings into QColor is expensive enough to
+    matter inside paintEvent; callers must treat the returned instance as
+    read-only.
+    """
+    return QColor(name)
@@ -1,21 +1,29 @@
+import os
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 class QSSProcessor:
+    _PROCESSED_CACHE_MAX = 64
+
     def __init__(self, variables: dict = None):
         self.variables = variables or {}
-        
-        self._template_cache: Dict[str, str] = {}
-        self._processed_cache: Dict[str, str] = {}
+
+        self._template_cache: Dict[str, Tuple[float, str]] = {}
+        # Keyed by (path, variables fingerprint) so toggling back to a
+        # previously seen theme hits warm entries; LRU-bounded.
+        self._processed_cache: "OrderedDict[tuple, str]" = OrderedDict()
         self._compile_pattern()
 
     def set_variables(self, variables: dict):
         self.variables = variables
         self._compile_pattern()
-        self._processed_cache.clear()
 
     def _compile_pattern(self):
+        # Stringify values once here instead of per regex match.
+        self._str_vars = {k: str(v) for k, v in self.variables.items()}
+        self._vars_key = hash(tuple(sorted(self._str_vars.items())))
         if not self.variables:
             self._pattern = None
             return
@@ -25,41 +33,74 @@ class QSSProcessor:
         self._pattern = re.compile(pattern)
 
     def _read_template(self, qss_path: str) -> str:
-        if qss_path in self._template_cache:
-            return self._template_cache[qss_path]
-
-        path = Path(qss_path)
-        if not path.exists():
+        try:
+            mtime = os.path.getmtime(qss_path)
+        except OSError:
             raise FileNotFoundError(f"QSS file not found: {qss_path}")
-        
-        content = path.read_text(encoding="utf-8")
-        self._template_cache[qss_path] = content
+
+        cached = self._template_cache.get(qss_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        content = Path(qss_path).read_text(encoding="utf-8")
+        self._template_cache[qss_path] = (mtime, content)
+        if cached is not None:
+            # The template changed on disk; drop stylesheets built from it
+            # (bundle keys are "|"-joined paths, so substring match covers them).
+            for key in [k for k in self._processed_cache if qss_path in k[0]]:
+                del self._processed_cache[key]
         return content
 
     def apply_to_string(self, qss_content: str) -> str:
         if not self._pattern:
             return qss_content
 
+        str_vars = self._str_vars
+
         def _repl(m):
             key = m.group(0)
-            return str(self.variables.get(key, key))
+            return str_vars.get(key, key)
         return self._pattern.sub(_repl, qss_content)
 
     def get_processed_stylesheet(self, qss_path: str) -> str:
-        if qss_path in self._processed_cache:
-            return self._processed_cache[qss_path]
-
+        # Stat/read the template first: _read_template purges processed
+        # entries built from a changed file, so a warm hit below is never
+        # served from a stale on-disk template.
         template_content = self._read_template(qss_path)
+
+        key = (qss_path, self._vars_key)
+        cached = self._processed_cache.get(key)
+        if cached is not None:
+            self._processed_cache.move_to_end(key)
+            return cached
+
         processed_content = self.apply_to_string(template_content)
-        self._processed_cache[qss_path] = processed_content
-        
+        if len(self._processed_cache) >= self._PROCESSED_CACHE_MAX:
+            self._processed_cache.popitem(last=False)
+        self._processed_cache[key] = processed_content
+
         return processed_content
 
     def apply_to_file(self, qss_path: str) -> str:
         return self.get_processed_stylesheet(qss_path)
 
     def apply_to_files(self, qss_paths: list[str]) -> str:
-        contents = []
-        for path in qss_paths:
-            contents.append(self.get_processed_stylesheet(path))
-        return "\n".join(contents)
\ No newline at end of file
+        if not qss_paths:
+            return ""
+        # Read every template before the cache lookup so _read_template's
+        # stale-entry purge runs first (see get_processed_stylesheet). One
+        # substitution pass over the joined templates instead of one regex
+        # run per file.
+        joined_raw = "\n".join(self._read_template(path) for path in qss_paths)
+
+        key = ("|".join(qss_paths), self._vars_key)
+        cached = self._processed_cache.get(key)
+        if cached is not None:
+            self._processed_cache.move_to_end(key)
+            return cached
+
+        processed = self.apply_to_string(joined_raw)
+        if len(self._processed_cache) >= self._PROCESSED_CACHE_MAX:
+            self._processed_cache.popitem(last=False)
+        self._processed_cache[key] = processed
+        return processed
\ No newline at end of file
@@ -1,18 +1,58 @@
 import os
-import yaml 
+import json
+import time
+import yaml
 import threading
-from types import SimpleNamespace 
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Any, Dict, Optional
 
+try:
+    # libyaml-backed loader; same safety profile as safe_load, ~5-10x faster.
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 _FILE_CACHE: Dict[str, Dict[str, Any]] = {}
+# path -> (comp_data identity, normalized candidate plan); rebuilt whenever
+# _FILE_CACHE serves a fresh data object for the path.
+_RESOLVE_PLAN_CACHE: Dict[str, tuple] = {}
 _CACHE_LOCK = threading.RLock()
 
+@lru_cache(maxsize=4096)
+def _parse_token(value: str):
+    """'{a.b.c}' -> ('a', 'b', 'c'); None for non-token strings."""
+    if value.startswith("{") and value.endswith("}"):
+        return tuple(value[1:-1].split("."))
+    return None
+
+def _to_namespace(obj: Any) -> Any:
+    if isinstance(obj, (dict, list)):
+        try:
+            return json.loads(json.dumps(obj),
+                              object_hook=lambda d: SimpleNamespace(**d))
+        except (TypeError, ValueError):
+            pass
+    return _to_namespace_py(obj)
+
+def _to_namespace_py(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return SimpleNamespace(**{k: _to_namespace_py(v) for k, v in obj.items()})
+    elif isinstance(obj, list):
+        return [_to_namespace_py(item) for item in obj]
+    else:
+        return obj
+
 class YAMLProcessor:
+    # Minimum seconds between mtime stats of the same file; lookups arriving
+    # within this window reuse the cached data without a syscall.
+    refresh_interval = 0.1
+
     def __init__(self, path: str):
         self.path = path
         data = self._load_file_cached(self.path)
         self.data = data or {}
-        self.ns = self.dict_to_namespace(self.data)
+        self.ns = self._get_cached_ns(self.path)
         
 #region Cache Helpers
     @staticmethod
@@ -26,19 +66,43 @@ class YAMLProcessor:
     def _load_file_cached(cls, path: str) -> Dict[str, Any]:
         path = str(path)
         with _CACHE_LOCK:
-            mtime = cls._get_mtime(path)
+            now = time.monotonic()
             cached = _FILE_CACHE.get(path)
+            if cached and now - cached.get("last_check", 0.0) < cls.refresh_interval:
+                return cached.get("data")
+            mtime = cls._get_mtime(path)
             if cached:
                 if cached.get("mtime") == mtime:
+                    cached["last_check"] = now
                     return cached.get("data")
             try:
                 with open(path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                    data = yaml.load(f, Loader=_Loader) or {}
             except FileNotFoundError:
                 data = {}
-            _FILE_CACHE[path] = {"mtime": mtime, "data": data}
+            _FILE_CACHE[path] = {"mtime": mtime, "data": data, "last_check": now}
             return data
 
+    @classmethod
+    def _get_cached_ns(cls, path: str) -> Any:
+        """Namespace view of a cached file, converted once per (path, mtime).
+
+        Shared across processors of the same file; callers must treat the
+        returned namespaces as read-only. Reloads replace the cache entry
+        wholesale, so a stale namespace is dropped automatically.
+        """
+        path = str(path)
+        data = cls._load_file_cached(path)
+        with _CACHE_LOCK:
+            cached = _FILE_CACHE.get(path)
+            if cached is not None:
+                ns = cached.get("ns")
+                if ns is None:
+                    ns = _to_namespace(data)
+                    cached["ns"] = ns
+                return ns
+        return _to_namespace(data)
+
     @classmethod
     def clear_cache(cls):
         """Clear the internal file cache (useful for tests / dev)."""
@@ -52,7 +116,7 @@ class YAMLProcessor:
         with _CACHE_LOCK:
             try:
                 with open(path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                    data = yaml.load(f, Loader=_Loader) or {}
             except FileNotFoundError:
                 data = {}
             mtime = cls._get_mtime(path)
@@ -66,7 +130,7 @@ class YAMLProcessor:
         """Reload the instance's path and update internal data/namespace."""
         newdata = self._load_file_cached(self.path) or {}
         self.data = newdata
-        self.ns = self.dict_to_namespace(self.data)
+        self.ns = self._get_cached_ns(self.path)
         return self.data
 
     def yaml_to_dict(self) -> Dict[str, Any]:
@@ -74,17 +138,16 @@ class YAMLProcessor:
         return dict(self._load_file_cached(self.path) or {})
         
     def dict_to_namespace(self, obj: Any) -> Any:
-        """Recursively convert dict->SimpleNamespace; lists preserved."""
-        if isinstance(obj, dict):
-            return SimpleNamespace(**{k: self.dict_to_namespace(v) for k, v in obj.items()})
-        elif isinstance(obj, list):
-            return [self.dict_to_namespace(item) for item in obj]
-        else:
-            return obj
+        """Convert dict->SimpleNamespace; lists preserved.
+
+        Uses a json round-trip with object_hook (C-implemented traversal)
+        when the data is JSON-representable, falling back to Python
+        recursion for anything exotic.
+        """
+        return _to_namespace(obj)
 
     def yaml_to_namespace(self) -> SimpleNamespace:
-        data = self._load_file_cached(self.path) or {}
-        return self.dict_to_namespace(data)
+        return self._get_cached_ns(self.path)
 #endregion
 
 #region Resolving Helpers
@@ -97,8 +160,8 @@ class YAMLProcessor:
         if not isinstance(value, str):
             return value
 
-        if value.startswith("{") and value.endswith("}"):
-            key_path = value.strip("{}").split(".")
+        key_path = _parse_token(value)
+        if key_path is not None:
             result = self.data
             for k in key_path:
                 if isinstance(result, dict) and (k in result):
@@ -120,34 +183,73 @@ class YAMLProcessor:
             return alt.get(theme, {}) or {}
         return {}
 
+    def _resolve_plan(self, path: str) -> list:
+        """Normalized candidate list per component, built once per file load.
+
+        Each plan entry is (component, original attrs, candidates), where a
+        candidate is (token path tuple, None) for "{a.b.c}" placeholders or
+        (None, literal value) otherwise. The type dispatch and token parsing
+        therefore run once per component YAML instead of on every resolve().
+        """
+        path = str(path)
+        comp_data = self._load_file_cached(path) or {}
+        with _CACHE_LOCK:
+            cached = _RESOLVE_PLAN_CACHE.get(path)
+            if cached is not None and cached[0] is comp_data:
+                return cached[1]
+
+            plan = []
+            for comp, attrs in (comp_data.items() if isinstance(comp_data, dict) else []):
+                if isinstance(attrs, str):
+                    raw = [attrs]
+                elif isinstance(attrs, list):
+                    raw = list(attrs)
+                elif isinstance(attrs, dict):
+                    raw = list(attrs.values())
+                elif attrs is None:
+                    raw = []
+                else:
+                    raw = [attrs]
+
+                candidates = []
+                for value in raw:
+                    token_parts = _parse_token(value) if isinstance(value, str) else None
+                    if token_parts is not None:
+                        candidates.append((token_parts, None))
+                    else:
+                        candidates.append((None, value))
+                plan.append((comp, attrs, candidates))
+
+            _RESOLVE_PLAN_CACHE[path] = (comp_data, plan)
+            return plan
+
     def resolve(self, path: str, theme: str = "Default") -> Dict[str, Any]:
         """
         Resolve a component YAML (path) using values from self.data (the theme resource).
-        - Uses cached load for `path`
-        - For each component entry, expand tokens with resolve_value()
-        - Lookup values under the specified theme namespace (from self.data)
+        - Uses the precompiled per-path plan (see _resolve_plan)
+        - Expands tokens against self.data, then looks values up under the
+          specified theme namespace (from self.data)
         Returns a dict: {component_key: resolved_value_or_original}
         """
-        comp_data = self._load_file_cached(path) or {}
+        plan = self._resolve_plan(path)
         resolved: Dict[str, Any] = {}
 
         theme_dict = self._get_theme_dict(theme)
+        data = self.data
 
-        for comp, attrs in (comp_data.items() if isinstance(comp_data, dict) else []):
-            keys = []
-            if isinstance(attrs, str):
-                keys = [self.resolve_value(attrs)]
-            elif isinstance(attrs, list):
-                keys = [self.resolve_value(v) for v in attrs]
-            elif isinstance(attrs, dict):
-                keys = [self.resolve_value(v) for v in attrs.values()]
-            elif attrs is None:
-                keys = []
-            else:
-                keys = [attrs]
-
+        for comp, attrs, candidates in plan:
             found = None
-            for key in keys:
+            for token_parts, literal in candidates:
+                if token_parts is not None:
+                    key = data
+                    for part in token_parts:
+                        if isinstance(key, dict) and part in key:
+                            key = key[part]
+                        else:
+                            key = None
+                            break
+                else:
+                    key = literal
                 if key is None:
                     continue
                 if isinstance(key, (dict, list)):